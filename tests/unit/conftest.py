@@ -0,0 +1,22 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+
+@pytest.fixture(scope="session")
+def mock_data() -> pd.DataFrame:
+    rng = np.random.default_rng(12345)
+    data = pd.DataFrame({"x": rng.normal(size=100), "x2": rng.normal(size=100), "x3": rng.normal(size=100)})
+    data["y"] = (data["x"] > 0).astype(int)
+    return data
+
+
+@pytest.fixture(scope="session")
+def fitted_lr_x(mock_data: pd.DataFrame) -> LogisticRegression:
+    return LogisticRegression().fit(mock_data[["x"]], mock_data["y"])
+
+
+@pytest.fixture(scope="session")
+def fitted_lr_xx2x3(mock_data: pd.DataFrame) -> LogisticRegression:
+    return LogisticRegression().fit(mock_data[["x", "x2", "x3"]], mock_data["y"])
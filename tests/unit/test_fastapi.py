@@ -0,0 +1,106 @@
+import asyncio
+import time
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+from sklearn.linear_model import LogisticRegression
+
+from unionml import Dataset, Model
+from unionml.fastapi import PredictionBatcher
+from unionml.model import ModelArtifact
+
+
+@pytest.fixture
+def model(mock_data: pd.DataFrame, fitted_lr_x: LogisticRegression) -> Model:
+    model = Model(name="model", init=LogisticRegression, dataset=Dataset(name="dataset", targets=["y"]))
+
+    @model.dataset.reader
+    def reader() -> pd.DataFrame:
+        return mock_data
+
+    model.artifact = ModelArtifact(fitted_lr_x)
+    return model
+
+
+@pytest.fixture
+def batch_sizes(model: Model) -> List[int]:
+    """Register a row-wise predictor on the model that records the number of rows of each call."""
+    batch_sizes: List[int] = []
+
+    @model.predictor
+    def predictor(obj: LogisticRegression, features: pd.DataFrame) -> List[float]:
+        batch_sizes.append(len(features))
+        return obj.predict_proba(features)[:, 1].tolist()
+
+    return batch_sizes
+
+
+def _predict(batcher: PredictionBatcher, requests, delay: float = 0):
+    async def submit():
+        batcher.start()
+        try:
+            results = []
+            for features in requests:
+                results.append(asyncio.ensure_future(batcher.predict(features)))
+                await asyncio.sleep(delay)
+            return await asyncio.wait_for(asyncio.gather(*results, return_exceptions=True), timeout=5)
+        finally:
+            await batcher.stop()
+
+    return asyncio.run(submit())
+
+
+def test_prediction_batcher(model, batch_sizes, mock_data):
+    requests = [mock_data[["x"]].iloc[i : i + n] for i, n in [(0, 3), (3, 1), (4, 5)]]
+    results = _predict(PredictionBatcher(model, max_size=32, max_delay_ms=50), requests)
+    assert batch_sizes == [9]
+    for features, result in zip(requests, results):
+        assert result == pytest.approx(model.predict(features=features))
+
+
+def test_prediction_batcher_max_size(model, batch_sizes, mock_data):
+    requests = [mock_data[["x"]].iloc[[i]] for i in range(5)]
+    start = time.monotonic()
+    _predict(PredictionBatcher(model, max_size=2, max_delay_ms=10_000), requests[:4])
+    assert time.monotonic() - start < 5
+    assert batch_sizes == [2, 2]
+
+
+def test_prediction_batcher_max_delay(model, batch_sizes, mock_data):
+    requests = [mock_data[["x"]].iloc[[i]] for i in range(3)]
+    _predict(PredictionBatcher(model, max_size=32, max_delay_ms=50), requests, delay=0.2)
+    assert batch_sizes == [1, 1, 1]
+
+
+@pytest.mark.parametrize(
+    "invalid_features",
+    [
+        pd.DataFrame({"x": [0.5], "z": [1.0]}),  # different columns than the rest of the batch
+        pd.DataFrame({"x": [np.nan]}),  # same columns, but fails the batched predictor call
+    ],
+)
+def test_prediction_batcher_error(model, batch_sizes, mock_data, invalid_features):
+    """An invalid request must only fail itself, not the other requests batched with it."""
+    valid_features = mock_data[["x"]].iloc[:2]
+    valid_result, invalid_result = _predict(
+        PredictionBatcher(model, max_size=32, max_delay_ms=50), [valid_features, invalid_features]
+    )
+    assert valid_result == pytest.approx(model.predict(features=valid_features))
+    assert isinstance(invalid_result, ValueError)
+
+
+def test_prediction_batcher_single_request(model, mock_data):
+    """A batch with a single request returns the predictor output unchanged, even if it isn't one row per input."""
+
+    @model.predictor
+    def predictor(obj: LogisticRegression, features: pd.DataFrame) -> float:
+        return float(obj.predict_proba(features)[:, 1].mean())
+
+    features = mock_data[["x"]].iloc[:10]
+    [result] = _predict(PredictionBatcher(model, max_size=32, max_delay_ms=50), [features])
+    assert result == model.predict(features=features)
+
+    results = _predict(PredictionBatcher(model, max_size=32, max_delay_ms=50), [features, features.iloc[:5]])
+    assert results == [model.predict(features=features), model.predict(features=features.iloc[:5])]
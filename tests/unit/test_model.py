@@ -0,0 +1,155 @@
+import io
+import warnings
+from dataclasses import dataclass
+from typing import List
+
+import numpy as np
+import pandas as pd
+import pytest
+import sklearn
+from sklearn.linear_model import LogisticRegression
+
+from unionml import Dataset, Model
+from unionml.model import SKLEARN_TENSORS_MAGIC, ModelArtifact
+
+
+@pytest.fixture
+def model() -> Model:
+    return Model(name="model", init=LogisticRegression, dataset=Dataset(name="dataset", targets=["y"]))
+
+
+def test_model_saver_and_loader_safetensors(model, fitted_lr_xx2x3, tmp_path):
+    model_object = fitted_lr_xx2x3
+    model.artifact = ModelArtifact(model_object)
+    model_path = tmp_path / "model.bin"
+    model.save(model_path)
+    assert model_path.read_bytes().startswith(SKLEARN_TENSORS_MAGIC)
+
+    loaded_model_object = model.load(model_path)
+    assert loaded_model_object.get_params() == model_object.get_params()
+    np.testing.assert_array_equal(loaded_model_object.coef_, model_object.coef_)
+    np.testing.assert_array_equal(loaded_model_object.feature_names_in_, model_object.feature_names_in_)
+
+    fileobj = io.BytesIO()
+    model.save(fileobj)
+    fileobj.seek(0)
+    np.testing.assert_array_equal(model.load(fileobj).coef_, model_object.coef_)
+
+
+@pytest.mark.parametrize("format", ["safetensors", "pickle"])
+def test_model_loader_file_overwritten(model, fitted_lr_x, fitted_lr_xx2x3, tmp_path, format):
+    """Overwriting the model file, including with a smaller one, must not affect a model loaded from it."""
+    model.artifact = ModelArtifact(fitted_lr_xx2x3)
+    model_path = tmp_path / "model.bin"
+    model.save(model_path)
+    loaded_model_object = model.load(model_path)
+    expected_coef = loaded_model_object.coef_.copy()
+
+    model.artifact = ModelArtifact(fitted_lr_x)
+    model.save(model_path, format=format)
+    np.testing.assert_array_equal(loaded_model_object.coef_, expected_coef)
+
+
+def test_model_saver_joblib_kwargs(model, fitted_lr_xx2x3, tmp_path):
+    model_object = fitted_lr_xx2x3
+    model.artifact = ModelArtifact(model_object)
+    model_path = tmp_path / "model.joblib"
+    model.save(model_path, compress=3)
+    assert not model_path.read_bytes().startswith(SKLEARN_TENSORS_MAGIC)
+    np.testing.assert_array_equal(model.load(model_path).coef_, model_object.coef_)
+
+    with pytest.raises(TypeError):
+        model.save(model_path, format="safetensors", compress=3)
+
+
+def test_model_loader_sklearn_version_mismatch(model, fitted_lr_xx2x3, tmp_path, monkeypatch):
+    model.artifact = ModelArtifact(fitted_lr_xx2x3)
+    model_path = tmp_path / "model.bin"
+    with monkeypatch.context() as m:
+        m.setattr(sklearn, "__version__", "0.0.1")
+        model.save(model_path)
+
+    with pytest.warns(UserWarning, match="0.0.1"):
+        model.load(model_path)
+
+    model.save(model_path)
+    with warnings.catch_warnings():
+        warnings.simplefilter("error")
+        model.load(model_path)
+
+
+def _make_trainable(model: Model, mock_data: pd.DataFrame) -> Model:
+    @model.dataset.reader
+    def reader() -> pd.DataFrame:
+        return mock_data
+
+    @model.trainer
+    def trainer(obj: LogisticRegression, features: pd.DataFrame, target: pd.DataFrame) -> LogisticRegression:
+        return obj.fit(features, target.squeeze())
+
+    @model.predictor
+    def predictor(obj: LogisticRegression, features: pd.DataFrame) -> List[float]:
+        return obj.predict(features).astype(float).tolist()
+
+    @model.evaluator
+    def evaluator(obj: LogisticRegression, features: pd.DataFrame, target: pd.DataFrame) -> float:
+        return float(obj.score(features, target.squeeze()))
+
+    return model
+
+
+@pytest.fixture
+def trainable_model(model: Model, mock_data: pd.DataFrame) -> Model:
+    return _make_trainable(model, mock_data)
+
+
+@pytest.mark.parametrize("splitter_kwargs", [None, {"test_size": 0.5, "random_state": 1}])
+def test_model_train_use_flyte(trainable_model, splitter_kwargs):
+    """Training in-process must produce the same results as training through the local Flyte workflow."""
+    train_kwargs = {"hyperparameters": {"C": 0.1}, "splitter_kwargs": splitter_kwargs}
+    flyte_model_object, flyte_metrics = trainable_model.train(**train_kwargs)
+    model_object, metrics = trainable_model.train(**train_kwargs, use_flyte=False)
+    assert metrics == flyte_metrics
+    np.testing.assert_allclose(model_object.coef_, flyte_model_object.coef_)
+
+
+@dataclass
+class Solver:
+    name: str
+
+
+def test_model_train_use_flyte_nested_hyperparameters(mock_data):
+    """Nested hyperparameter dataclasses must be passed to ``init`` as dictionaries whether or not flyte is used."""
+    init_solvers = []
+
+    def init(solver: dict) -> LogisticRegression:
+        init_solvers.append(solver)
+        return LogisticRegression(solver=solver["name"])
+
+    trainable_model = Model(
+        name="model",
+        init=init,
+        hyperparameter_config={"solver": Solver},
+        dataset=Dataset(name="dataset", targets=["y"]),
+    )
+    _make_trainable(trainable_model, mock_data)
+    trainable_model.train(hyperparameters={"solver": Solver(name="liblinear")})
+    trainable_model.train(hyperparameters={"solver": Solver(name="liblinear")}, use_flyte=False)
+    assert init_solvers == [{"name": "liblinear"}, {"name": "liblinear"}]
+
+
+@dataclass
+class LogisticRegressionInit:
+    # dataclasses with eq=True (the default) set __hash__ to None, so instances are unhashable
+    max_iter: int = 200
+
+    def __call__(self, C: float = 1.0) -> LogisticRegression:
+        return LogisticRegression(C=C, max_iter=self.max_iter)
+
+
+def test_model_unhashable_init(mock_data):
+    model = Model(name="model", init=LogisticRegressionInit(), dataset=Dataset(name="dataset", targets=["y"]))
+    _make_trainable(model, mock_data)
+    assert model.model_type is LogisticRegression
+    model_object, _ = model.train(hyperparameters={"C": 0.1}, use_flyte=False)
+    assert model_object.C == 0.1
@@ -0,0 +1,6 @@
+"""Entrypoint for running the unionml cli with ``python -m unionml``."""
+
+from unionml.cli import app
+
+if __name__ == "__main__":
+    app(prog_name="unionml")
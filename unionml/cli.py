@@ -1,18 +1,16 @@
 """unionml cli."""
 
-import copy
-import json
 import os
 import sys
 from enum import Enum
 from pathlib import Path
+from typing import Any, Dict, Optional, cast
 
 import click
 import typer
-import uvicorn
-from cookiecutter.main import cookiecutter
 
 from unionml.remote import VersionFetchError, get_app_version, get_model, get_model_execution
+from unionml.utils import json_loads
 
 sys.path.append(os.curdir)
 
@@ -23,6 +21,19 @@ IMAGE_PREFIX = "unionml"
 FLYTE_SANDBOX_CONTAINER_NAME = "flyte-sandbox"
 
 
+def parse_json_option(value: Optional[str]) -> Dict[str, Any]:
+    """Parse a json string option into a dictionary when typer binds the command-line arguments."""
+    if value is None:
+        return {}
+    try:
+        parsed = json_loads(value)
+    except ValueError as exc:
+        raise typer.BadParameter(f"invalid json string: {exc}") from exc
+    if not isinstance(parsed, dict):
+        raise typer.BadParameter(f"expected a json object, found {value}")
+    return parsed
+
+
 class AppTemplate(str, Enum):
     basic = "basic"
     basic_aws_lambda = "basic-aws-lambda"
@@ -41,6 +52,8 @@ def init(
     ),
 ):
     r"""Initialize a UnionML project."""
+    from cookiecutter.main import cookiecutter
+
     config = {
         "app_name": app_name,
     }
@@ -85,28 +98,43 @@ def deploy(
 @app.command()
 def train(
     app: str,
-    inputs: str = typer.Option(None, "--inputs", "-i", help="json string of inputs to pass into training workflow"),
+    inputs: str = typer.Option(
+        None,
+        "--inputs",
+        "-i",
+        callback=parse_json_option,
+        help="json string of inputs to pass into training workflow",
+    ),
     app_version: str = typer.Option(None, "--app-version", "-v", help="app version"),
     wait: bool = typer.Option(False, "--wait", "-w", help="whether or not to wait for remote execution to complete."),
 ):
     r"""Train a model."""
     typer.echo(f"[unionml] app: {app} - training model")
     model = get_model(app)
-    train_inputs = {}
-    if inputs:
-        train_inputs.update(json.loads(inputs))
-    model.remote_train(app_version, wait, **train_inputs)
+    model.remote_train(app_version, wait, **cast(Dict[str, Any], inputs))
     if wait:
         assert model.artifact is not None
-        typer.echo("[unionml] training completed with model artifacts:")
-        typer.echo(f"[unionml] model object: {model.artifact.model_object}")
-        typer.echo(f"[unionml] model metrics: {model.artifact.metrics}")
+        typer.echo(
+            "\n".join(
+                [
+                    "[unionml] training completed with model artifacts:",
+                    f"[unionml] model object: {model.artifact.model_object}",
+                    f"[unionml] model metrics: {model.artifact.metrics}",
+                ]
+            )
+        )
 
 
 @app.command()
 def predict(
     app: str,
-    inputs: str = typer.Option(None, "--inputs", "-i", help="json string of inputs tp pass into predict workflow"),
+    inputs: str = typer.Option(
+        None,
+        "--inputs",
+        "-i",
+        callback=parse_json_option,
+        help="json string of inputs tp pass into predict workflow",
+    ),
     features: Path = typer.Option(None, "--features", "-f", help="generate predictions for this feature"),
     app_version: str = typer.Option(None, "--app-version", "-v", help="app version"),
     model_version: str = typer.Option(None, "--model-version", "-m", help="model version"),
@@ -116,11 +144,9 @@ def predict(
     typer.echo(f"[unionml] app: {app} - generating predictions")
     model = get_model(app)
 
-    prediction_inputs = {}
-    if inputs:
-        prediction_inputs.update(json.loads(inputs))
-    elif features:
-        prediction_inputs.update({"features": model._dataset.get_features(features)})
+    prediction_inputs = cast(Dict[str, Any], inputs)
+    if not prediction_inputs and features:
+        prediction_inputs = {"features": model._dataset.get_features(features)}
 
     predictions = model.remote_predict(app_version, model_version, wait=wait, **prediction_inputs)
     if wait:
@@ -150,17 +176,19 @@ def fetch_model(
     app_version: str = typer.Option(None, "--app-version", "-v", help="app version"),
     model_version: str = typer.Option("latest", "--model-version", "-m", help="model version"),
     output_file: str = typer.Option(None, "--output-file", "-o", help="output file path"),
-    kwargs: str = typer.Option(None, "--kwargs", help="json string of kwargs to pass into model.save"),
+    kwargs: str = typer.Option(
+        None,
+        "--kwargs",
+        callback=parse_json_option,
+        help="json string of kwargs to pass into model.save",
+    ),
 ):
     r"""Fetch a model object from the remote backend."""
     model = get_model(app)
     app_version = app_version or get_app_version(allow_uncommitted=True)
     execution = get_model_execution(model, app_version, model_version=model_version)
     model.remote_load(execution)
-    save_kwargs = {}
-    if kwargs is not None:
-        save_kwargs = json.loads(kwargs)
-    model.save(output_file, **save_kwargs)
+    model.save(output_file, **cast(Dict[str, Any], kwargs))
     typer.echo(f"[unionml] app: {app} - saving model version {execution.id.name} to {output_file}")
 
 
@@ -169,21 +197,25 @@ def callback():
     r"""unionml command-line tool."""
 
 
-def serve_command():
-    r"""Modify the uvicorn.main entrypoint for unionml app serving."""
-    fn = copy.deepcopy(uvicorn.main)
-    fn.name = "serve"
-    fn.short_help = "Serve an unionml model."
-    fn.help = (
-        "Serve an unionml model using uvicorn. This command uses the main uvicorn entrypoint with an additional "
-        "``--model-path`` argument.\n\nFor more information see: https://www.uvicorn.org/#command-line-options"
-    )
+class ServeCommand(click.Command):
+    """A click command that composes the uvicorn.main entrypoint, importing uvicorn only when it's needed.
+
+    The uvicorn.main params are prepended to this command's params the first time a context is made for it, i.e.
+    when ``unionml serve`` is invoked or its help text is shown.
+    """
+
+    def make_context(self, info_name, args, parent=None, **extra):
+        if self.callback is None:
+            import uvicorn
 
-    option = click.Option(param_decls=["--model-path"], default=None, help="model path to use for serving", type=Path)
-    fn.params.append(option)
+            # reuse the uvicorn.main params instead of copying the command so that uvicorn's objects are never mutated
+            self.context_settings = {**uvicorn.main.context_settings, **self.context_settings}
+            self.params = [*uvicorn.main.params, *self.params]
+            self.callback = _serve_callback(uvicorn.main.callback)
+        return super().make_context(info_name, args, parent=parent, **extra)
 
-    callback = fn.callback
 
+def _serve_callback(callback):
     def custom_callback(**kwargs):
         if os.getenv("UNIONML_MODEL_PATH"):
             typer.echo(
@@ -199,10 +231,43 @@ def serve_command():
                 typer.echo(f"Model path {model_path} not found.", err=True)
                 raise typer.Exit(code=1)
             os.environ["UNIONML_MODEL_PATH"] = str(model_path)
+        os.environ["UNIONML_BATCH_MAX_SIZE"] = str(kwargs.pop("batch_max_size"))
+        os.environ["UNIONML_BATCH_MAX_DELAY_MS"] = str(kwargs.pop("batch_max_delay_ms"))
         return callback(**kwargs)
 
-    fn.callback = custom_callback
-    return fn
+    return custom_callback
+
+
+def serve_command():
+    r"""Create a command that uses the uvicorn.main entrypoint for unionml app serving."""
+    return ServeCommand(
+        name="serve",
+        params=[
+            click.Option(param_decls=["--model-path"], default=None, help="model path to use for serving", type=Path),
+            click.Option(
+                param_decls=["--batch-max-size"],
+                default=32,
+                show_default=True,
+                type=click.IntRange(min=1),
+                help="maximum number of concurrent feature requests to group into a single prediction call. "
+                "Set to 1 to disable request batching.",
+            ),
+            click.Option(
+                param_decls=["--batch-max-delay-ms"],
+                default=5.0,
+                show_default=True,
+                type=click.FloatRange(min=0),
+                help="maximum time in milliseconds to wait for more requests before generating predictions for a "
+                "batch.",
+            ),
+        ],
+        short_help="Serve an unionml model.",
+        help=(
+            "Serve an unionml model using uvicorn. This command uses the main uvicorn entrypoint with additional "
+            "``--model-path``, ``--batch-max-size``, and ``--batch-max-delay-ms`` arguments.\n\n"
+            "For more information see: https://www.uvicorn.org/#command-line-options"
+        ),
+    )
 
 
 # convert typer app to click object to define a "serve" command
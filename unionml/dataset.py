@@ -1,6 +1,5 @@
 """Dataset class for defining data source, splitting, parsing, and iteration."""
 
-import json
 from dataclasses import _MISSING_TYPE, field, make_dataclass
 from enum import Enum
 from functools import partial
@@ -21,7 +20,7 @@ from sklearn.model_selection import train_test_split
 
 import unionml.type_guards as type_guards
 from unionml.defaults import DEFAULT_RESOURCES
-from unionml.utils import inner_task
+from unionml.utils import inner_task, json_loads
 
 R = TypeVar("R")  # raw data
 D = TypeVar("D")  # model-ready data
@@ -488,8 +487,7 @@ class Dataset(TrackedInstance):
 
     def _default_feature_loader(self, features: Any) -> R:
         if isinstance(features, Path):
-            with features.open() as f:
-                features = json.load(f)
+            features = json_loads(features.read_bytes())
 
         [(_, data_type)] = self.dataset_datatype.items()
 
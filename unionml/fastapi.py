@@ -1,10 +1,14 @@
 """Utilities for the FastAPI integration."""
 
+import asyncio
+import contextlib
 import os
 from http import HTTPStatus
-from typing import Any, Dict, List, Optional, Union
+from typing import Any, Dict, List, Optional, Tuple, Union
 
+import pandas as pd
 from fastapi import Body, FastAPI, HTTPException
+from fastapi.concurrency import run_in_threadpool
 from fastapi.responses import HTMLResponse
 from pydantic import BaseModel
 
@@ -12,6 +16,113 @@ from unionml.model import Model, ModelArtifact
 from unionml.remote import get_model_artifact
 
 
+def prefetch_model_file(path: str):
+    """Ask the kernel to start reading the model file into the page cache before it's deserialized.
+
+    The page cache is shared across processes, so with ``uvicorn --workers N`` the file is only read from disk once.
+    Each worker still deserializes its own copy of the model object into its own memory.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    # any errors opening the file are surfaced by the model loader
+    with contextlib.suppress(OSError):
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+
+
+class PredictionBatcher:
+    """Group concurrent feature prediction requests into a single ``model.predict`` call.
+
+    Requests are accumulated for up to ``max_delay_ms`` milliseconds or until ``max_size`` requests are queued,
+    whichever comes first. Requests with the same feature columns are concatenated into one dataframe and the
+    predictions are split back into per-request results, which assumes that the predictor returns one prediction per
+    row. If a batched call fails or doesn't return one prediction per row, each request in it is predicted on its own,
+    so errors are only reported to the requests that cause them.
+    """
+
+    def __init__(self, model: Model, max_size: int, max_delay_ms: float):
+        self._model = model
+        self._max_size = max_size
+        self._max_delay = max_delay_ms / 1000
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    def start(self):
+        # the queue needs to be created within the event loop that's serving requests
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.ensure_future(self._run())
+
+    async def stop(self):
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+
+    async def predict(self, features: pd.DataFrame) -> Any:
+        assert self._queue is not None, "PredictionBatcher.start must be called before submitting predictions."
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((features, future))
+        return await future
+
+    async def _next_batch(self) -> List[Tuple[pd.DataFrame, asyncio.Future]]:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self._max_delay
+        while len(batch) < self._max_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _run(self):
+        while True:
+            batch = await self._next_batch()
+            groups: Dict[Tuple, List[Tuple[pd.DataFrame, asyncio.Future]]] = {}
+            for request in batch:
+                groups.setdefault(tuple(request[0].columns), []).append(request)
+            for group in groups.values():
+                if len(group) == 1 or not await self._predict_batch(group):
+                    for features, future in group:
+                        await self._predict_request(features, future)
+
+    async def _predict_batch(self, batch: List[Tuple[pd.DataFrame, asyncio.Future]]) -> bool:
+        """Predict the concatenated features of the batch, returning False if the results can't be split up."""
+        try:
+            features = pd.concat([features for features, _ in batch], ignore_index=True)
+            predictions = await run_in_threadpool(self._model.predict, features=features)
+            if len(predictions) != len(features):
+                return False
+        except Exception:
+            return False
+
+        offset = 0
+        for features, future in batch:
+            if not future.done():
+                future.set_result(predictions[offset : offset + len(features)])
+            offset += len(features)
+        return True
+
+    async def _predict_request(self, features: pd.DataFrame, future: asyncio.Future):
+        try:
+            predictions = await run_in_threadpool(self._model.predict, features=features)
+        except Exception as exc:
+            if not future.done():
+                future.set_exception(exc)
+        else:
+            if not future.done():
+                future.set_result(predictions)
+
+
 def serving_app(
     model: Model,
     app: FastAPI,
@@ -19,6 +130,8 @@ def serving_app(
     app_version: Optional[str] = None,
     model_version: str = "latest",
 ):
+    batcher: Optional[PredictionBatcher] = None
+
     @app.on_event("startup")
     async def setup_model():
         model_path = os.getenv("UNIONML_MODEL_PATH")
@@ -29,10 +142,25 @@ def serving_app(
                         "Model artifact path not specified. Make sure to specify the unionml serve --model-path in "
                         "the option when starting the unionml prediction service in local mode."
                     )
+                prefetch_model_file(model_path)
                 model.artifact = ModelArtifact(model.load(model_path))
             else:
                 model.artifact = get_model_artifact(model, app_version=app_version, model_version=model_version)
 
+    @app.on_event("startup")
+    async def setup_batcher():
+        nonlocal batcher
+        batch_max_size = int(os.getenv("UNIONML_BATCH_MAX_SIZE", "1"))
+        batch_max_delay_ms = float(os.getenv("UNIONML_BATCH_MAX_DELAY_MS", "0"))
+        if batch_max_size > 1 and model._dataset.dataset_datatype["data"] is pd.DataFrame:
+            batcher = PredictionBatcher(model, batch_max_size, batch_max_delay_ms)
+            batcher.start()
+
+    @app.on_event("shutdown")
+    async def teardown_batcher():
+        if batcher is not None:
+            await batcher.stop()
+
     @app.get("/", response_class=HTMLResponse)
     def root():
         return """
@@ -59,6 +187,8 @@ def serving_app(
         if model._dataset.dataset_datatype is not None:
             # convert raw features to whatever the output type of the reader is.
             features = model._dataset.get_features(features)
+        if not inputs and batcher is not None:
+            return await batcher.predict(features)
         workflow_inputs.update(inputs if inputs else {"features": features})
 
         return model.predict(**workflow_inputs)
@@ -1,15 +1,23 @@
 """Model class for defining training, evaluation, and prediction."""
 
+import importlib
 import inspect
+import io
+import json
+import mmap
 import os
+import pickle
+import struct
 import uuid
+import warnings
 from collections import OrderedDict
 from dataclasses import asdict, dataclass, field, is_dataclass, make_dataclass
-from functools import partial
-from inspect import Parameter, signature
+from functools import lru_cache, partial, wraps
+from inspect import Parameter, Signature, signature
 from typing import IO, Any, Callable, Dict, List, NamedTuple, Optional, Tuple, Type, Union
 
 import joblib
+import numpy as np
 import pandas as pd
 import sklearn
 from dataclasses_json import dataclass_json
@@ -52,6 +60,208 @@ class ModelArtifact(NamedTuple):
     metrics: Optional[Dict[str, float]] = None
 
 
+# safetensors-style layout for sklearn estimators: magic, 8-byte little-endian header length, JSON header, raw bytes
+SKLEARN_TENSORS_MAGIC = b"UNIONML\x01"
+_SKLEARN_TENSORS_ALIGNMENT = 8
+
+
+def _save_sklearn_safetensors(
+    model_obj: Any,
+    hyperparameters: Optional[dict],
+    file: Union[str, os.PathLike, IO],
+) -> bool:
+    """Serialize an sklearn estimator as a JSON header followed by the raw bytes of its numeric arrays.
+
+    Returns ``False`` without writing anything if the estimator can't be represented losslessly in this format, in
+    which case the caller should fall back to pickle-based serialization.
+    """
+    model_cls = type(model_obj)
+    if model_cls.__module__.split(".")[0] != "sklearn":
+        return False
+
+    params = model_obj.get_params(deep=False)
+    header: Dict[str, Any] = {
+        "cls": f"{model_cls.__module__}:{model_cls.__qualname__}",
+        "sklearn_version": sklearn.__version__,
+        "params": params,
+        "hyperparameters": hyperparameters,
+        "attrs": {},
+        "arrays": {},
+    }
+    buffers: List[bytes] = []
+    offset = 0
+    for name, value in vars(model_obj).items():
+        if name in params:
+            continue
+        is_scalar = isinstance(value, np.generic)
+        if is_scalar:
+            value = np.asarray(value)
+        if isinstance(value, np.ndarray) and value.dtype.kind in "biufc":
+            dtype = value.dtype.newbyteorder("<")
+            data = np.ascontiguousarray(value, dtype=dtype).tobytes()
+            header["arrays"][name] = {
+                "dtype": dtype.str,
+                "shape": list(value.shape),
+                "data_offsets": [offset, offset + len(data)],
+                "scalar": is_scalar,
+            }
+            data += b"\x00" * (-len(data) % _SKLEARN_TENSORS_ALIGNMENT)
+            buffers.append(data)
+            offset += len(data)
+        elif (
+            isinstance(value, np.ndarray)
+            and value.dtype.kind in "OU"
+            and all(isinstance(x, str) for x in value.ravel().tolist())
+        ):
+            # e.g. ``feature_names_in_`` when the estimator is fitted on a dataframe
+            header["attrs"][name] = {
+                "strings": value.ravel().tolist(),
+                "shape": list(value.shape),
+                "dtype": value.dtype.str,
+            }
+        elif value is None or isinstance(value, (bool, int, float, str)):
+            header["attrs"][name] = {"value": value}
+        else:
+            return False
+
+    try:
+        header_json = json.dumps(header)
+    except (TypeError, ValueError):
+        return False
+    # make sure that the json round-trip doesn't change any values, e.g. tuple parameters turning into lists
+    roundtrip = json.loads(header_json)
+    if any(roundtrip[key] != header[key] for key in ("params", "hyperparameters", "attrs")):
+        return False
+
+    header_bytes = header_json.encode()
+    # pad the header so that the array data starts at an aligned offset
+    header_bytes += b" " * (-(len(SKLEARN_TENSORS_MAGIC) + 8 + len(header_bytes)) % _SKLEARN_TENSORS_ALIGNMENT)
+
+    chunks = [SKLEARN_TENSORS_MAGIC, struct.pack("<Q", len(header_bytes)), header_bytes, *buffers]
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "wb") as f:
+            f.writelines(chunks)
+    else:
+        file.writelines(chunks)
+    return True
+
+
+def _load_sklearn_safetensors(file: Union[str, os.PathLike, IO]) -> Optional[Tuple[Any, Optional[dict]]]:
+    """Deserialize an sklearn estimator written by :func:`_save_sklearn_safetensors`.
+
+    Arrays are copied out of a read-only memory map of the file when possible, which avoids reading the file into an
+    intermediate bytes object. The loaded estimator doesn't reference the file, so it's safe to overwrite it after
+    loading. Returns ``None`` if the file isn't in this format.
+    """
+    if isinstance(file, (str, os.PathLike)):
+        with open(file, "rb") as f:
+            return _load_sklearn_safetensors(f)
+
+    start = file.tell()
+    if file.read(len(SKLEARN_TENSORS_MAGIC)) != SKLEARN_TENSORS_MAGIC:
+        file.seek(start)
+        return None
+
+    buffer: Any
+    try:
+        buffer = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        base = start + len(SKLEARN_TENSORS_MAGIC)
+    except (AttributeError, OSError, io.UnsupportedOperation):
+        # in-memory file objects, e.g. io.BytesIO
+        buffer = file.read()
+        base = 0
+
+    try:
+        return _parse_sklearn_safetensors(buffer, base)
+    finally:
+        if isinstance(buffer, mmap.mmap):
+            buffer.close()
+
+
+def _parse_sklearn_safetensors(buffer: Any, base: int) -> Tuple[Any, Optional[dict]]:
+    (header_length,) = struct.unpack_from("<Q", buffer, base)
+    header = json.loads(bytes(buffer[base + 8 : base + 8 + header_length]))
+    data_start = base + 8 + header_length
+
+    module_name, qualname = header["cls"].split(":")
+    if module_name.split(".")[0] != "sklearn":
+        raise ValueError(f"Expected an sklearn estimator, found {header['cls']}")
+    model_cls: Any = importlib.import_module(module_name)
+    for attr in qualname.split("."):
+        model_cls = getattr(model_cls, attr)
+    if not (inspect.isclass(model_cls) and issubclass(model_cls, sklearn.base.BaseEstimator)):
+        raise ValueError(f"Expected an sklearn estimator, found {header['cls']}")
+
+    # mirror the check that sklearn performs when unpickling an estimator saved with a different version
+    saved_version = header.get("sklearn_version")
+    if saved_version != sklearn.__version__:
+        try:
+            from sklearn.exceptions import InconsistentVersionWarning
+        except ImportError:  # sklearn<1.3
+            warnings.warn(
+                f"Trying to load estimator {model_cls.__name__} from version {saved_version} when using version "
+                f"{sklearn.__version__}. This might lead to breaking code or invalid results. Use at your own risk.",
+                UserWarning,
+            )
+        else:
+            warnings.warn(
+                InconsistentVersionWarning(
+                    estimator_name=model_cls.__name__,
+                    current_sklearn_version=sklearn.__version__,
+                    original_sklearn_version=saved_version,
+                )
+            )
+
+    model_obj = model_cls(**header["params"])
+    for name, spec in header["arrays"].items():
+        begin, end = spec["data_offsets"]
+        dtype = np.dtype(spec["dtype"])
+        # copy the array out of the buffer so that the estimator doesn't depend on the file's contents after loading
+        array = (
+            np.frombuffer(buffer, dtype=dtype, count=(end - begin) // dtype.itemsize, offset=data_start + begin)
+            .reshape(spec["shape"])
+            .copy()
+        )
+        setattr(model_obj, name, array[()] if spec["scalar"] else array)
+    for name, spec in header["attrs"].items():
+        if "strings" in spec:
+            setattr(model_obj, name, np.array(spec["strings"], dtype=spec["dtype"]).reshape(spec["shape"]))
+        else:
+            setattr(model_obj, name, spec["value"])
+    return model_obj, header["hyperparameters"]
+
+
+@lru_cache(maxsize=256)
+def _cached_signature(fn: Callable) -> Signature:
+    return signature(fn)
+
+
+def _signature(fn: Callable) -> Signature:
+    # inspect.signature is relatively expensive and is called on the same functions every time a task is built or a
+    # training task is executed, so cache it. Signature objects are immutable, so they can be shared safely.
+    try:
+        return _cached_signature(fn)
+    except TypeError:
+        # unhashable callables, e.g. instances of dataclasses that define __call__, can't be cached
+        return signature(fn)
+
+
+def _jit_compile(fn: Callable) -> Callable:
+    try:
+        import numba
+    except ImportError as exc:
+        raise ImportError("numba is required to compile functions with jit=True: pip install numba") from exc
+
+    compiled_fn = numba.jit(forceobj=True, looplift=True)(fn)
+
+    # expose a plain function so that flytekit and the type guards see the original signature and annotations
+    @wraps(fn)
+    def wrapper(*args, **kwargs):
+        return compiled_fn(*args, **kwargs)
+
+    return wrapper
+
+
 class Model(TrackedInstance):
     def __init__(
         self,
@@ -105,7 +315,7 @@ class Model(TrackedInstance):
         if self._dataset.name is None:
             self._dataset.name = f"{self.name}.dataset"
 
-        # unionml-compiled tasks
+        # unionml-compiled tasks, which are cached until the functions they're composed of are re-registered
         self._train_task = None
         self._predict_task = None
         self._predict_from_features_task = None
@@ -114,7 +324,7 @@ class Model(TrackedInstance):
         self._train_task_kwargs: Optional[Dict[str, Any]] = None
         self._predict_task_kwargs: Optional[Dict[str, Any]] = None
 
-        # dynamically defined types
+        # dynamically defined types, which are generated once per model since make_dataclass is relatively expensive
         self._hyperparameter_type: Optional[Type] = None
 
         self._patch_destination_dir: Optional[str] = None
@@ -142,11 +352,12 @@ class Model(TrackedInstance):
         hyperparameter_fields: List[Any] = []
         if self._hyperparameter_config is None:
             # extract types from the init callable that instantiates a new model
-            model_obj_sig = signature(self._init_callable)  # type: ignore
+            model_obj_sig = _signature(self._init_callable)  # type: ignore
 
             # if any of the arguments are not type-annotated, default to using an untyped dictionary
             if any(p.annotation is inspect._empty for p in model_obj_sig.parameters.values()):
-                return dict
+                self._hyperparameter_type = dict
+                return self._hyperparameter_type
 
             for hparam_name, hparam in model_obj_sig.parameters.items():
                 hyperparameter_fields.append((hparam_name, hparam.annotation, field(default=hparam.default)))
@@ -193,6 +404,7 @@ class Model(TrackedInstance):
     def init(self, fn):
         """Register a function for initializing a model object."""
         self._init = fn
+        self._train_task = None
         return self._init
 
     def trainer(self, fn: Callable = None, **train_task_kwargs):
@@ -224,6 +436,7 @@ class Model(TrackedInstance):
 
         type_guards.guard_trainer(fn, self.model_type, expected_types)
         self._trainer = fn
+        self._train_task = None
         self._train_task_kwargs = {"requests": DEFAULT_RESOURCES, "limits": DEFAULT_RESOURCES, **train_task_kwargs}
         return self._trainer
 
@@ -244,6 +457,8 @@ class Model(TrackedInstance):
 
         type_guards.guard_predictor(fn, self.model_type, self._dataset.feature_type)
         self._predictor = fn
+        self._predict_task = None
+        self._predict_from_features_task = None
         self._predict_task_kwargs = {
             "requests": DEFAULT_RESOURCES,
             "limits": DEFAULT_RESOURCES,
@@ -251,8 +466,17 @@ class Model(TrackedInstance):
         }
         return self._predictor
 
-    def evaluator(self, fn):
-        """Register a function for producing metrics for given model object."""
+    def evaluator(self, fn=None, *, jit: bool = False):
+        """Register a function for producing metrics for given model object.
+
+        :param fn: function to use as the evaluator.
+        :param jit: if True, compile the evaluator with `numba <https://numba.pydata.org/>`__. Since the evaluator
+            receives a model object, the function itself runs in numba's object mode, but numeric loops over arrays,
+            e.g. a hand-written metric over predictions and targets, are lifted and compiled to machine code. This
+            requires ``numba`` to be installed.
+        """
+        if fn is None:
+            return partial(self.evaluator, jit=jit)
 
         if self.dataset._parser == self.dataset._default_parser:
             # Use the reader/loader datatype if parser is the default parser, otherwise use parser return type.
@@ -267,7 +491,10 @@ class Model(TrackedInstance):
             expected_types = self.dataset.parser_return_types
 
         type_guards.guard_evaluator(fn, self.model_type, expected_types)
+        if jit:
+            fn = _jit_compile(fn)
         self._evaluator = fn
+        self._train_task = None
         return self._evaluator
 
     def saver(self, fn):
@@ -285,7 +512,7 @@ class Model(TrackedInstance):
         """Parameters used to create a Flyte workflow for model object training."""
         return {
             name: param
-            for name, param in signature(self._trainer).parameters.items()
+            for name, param in _signature(self._trainer).parameters.items()
             if param.kind == Parameter.KEYWORD_ONLY
         }
 
@@ -379,11 +606,11 @@ class Model(TrackedInstance):
 
         This is used in the Flyte workflow produced by ``train_workflow``.
         """
-        if self._train_task:
+        if self._train_task is not None:
             return self._train_task
 
         # make sure hyperparameter type signature is correct
-        *_, hyperparameters_param = signature(self._init).parameters.values()
+        *_, hyperparameters_param = _signature(self._init).parameters.values()
         hyperparameters_param = hyperparameters_param.replace(annotation=self.hyperparameter_type)
 
         # assume that dataset_datatype is a dict with only a single entry
@@ -416,9 +643,9 @@ class Model(TrackedInstance):
             ),
             return_annotation=NamedTuple(
                 "ModelArtifact",
-                model_object=signature(self._trainer).return_annotation,
+                model_object=_signature(self._trainer).return_annotation,
                 hyperparameters=self.hyperparameter_type,
-                metrics=Dict[str, signature(self._evaluator).return_annotation],
+                metrics=Dict[str, _signature(self._evaluator).return_annotation],
             ),
             **({} if self._train_task_kwargs is None else self._train_task_kwargs),
         )
@@ -426,17 +653,16 @@ class Model(TrackedInstance):
             hyperparameters = kwargs["hyperparameters"]
             raw_data = kwargs[data_arg_name]
             trainer_kwargs = {p: kwargs[p] for p in self.trainer_params}
-
             hyperparameters_dict = asdict(hyperparameters) if is_dataclass(hyperparameters) else hyperparameters
-            training_data = self._dataset.get_data(raw_data)
-            model_object = self._trainer(
-                self._init(hyperparameters=hyperparameters_dict),
-                *training_data["train"],
-                **trainer_kwargs,
+            model_object, metrics = self._train(
+                hyperparameters_dict,
+                raw_data,
+                trainer_kwargs,
+                **{
+                    arg: asdict(kwargs[arg]) if is_dataclass(kwargs[arg]) else kwargs[arg]
+                    for arg in ["loader_kwargs", "splitter_kwargs", "parser_kwargs"]
+                },
             )
-            metrics = {
-                split_key: self._evaluator(model_object, *training_data[split_key]) for split_key in training_data
-            }
             return model_object, hyperparameters, metrics
 
         self._train_task = train_task
@@ -447,10 +673,10 @@ class Model(TrackedInstance):
 
         This is used in the Flyte workflow produced by ``predict_workflow``.
         """
-        if self._predict_task:
+        if self._predict_task is not None:
             return self._predict_task
 
-        predictor_sig = signature(self._predictor)
+        predictor_sig = _signature(self._predictor)
         model_param, *_ = predictor_sig.parameters.values()
         model_param = model_param.replace(name="model_object")
 
@@ -466,9 +692,7 @@ class Model(TrackedInstance):
             **self._predict_task_kwargs,
         )
         def predict_task(model_object, **kwargs):
-            parsed_data = self._dataset._parser(kwargs[data_arg_name], **self._dataset.parser_kwargs)
-            features = parsed_data[self._dataset._parser_feature_key]
-            return self._predictor(model_object, features)
+            return self._predict_from_raw_data(model_object, kwargs[data_arg_name])
 
         self._predict_task = predict_task
         return predict_task
@@ -478,10 +702,10 @@ class Model(TrackedInstance):
 
         This is used in the Flyte workflow produced by ``predict_from_features_workflow``.
         """
-        if self._predict_from_features_task:
+        if self._predict_from_features_task is not None:
             return self._predict_from_features_task
 
-        predictor_sig = signature(self._predictor)
+        predictor_sig = _signature(self._predictor)
         model_param, *_ = predictor_sig.parameters.values()
         model_param = model_param.replace(name="model_object")
 
@@ -508,6 +732,7 @@ class Model(TrackedInstance):
         splitter_kwargs: Optional[Dict[str, Any]] = None,
         parser_kwargs: Optional[Dict[str, Any]] = None,
         trainer_kwargs: Optional[Dict[str, Any]] = None,
+        use_flyte: bool = True,
         **reader_kwargs,
     ) -> Tuple[Any, Any]:
         """Train a model object locally
@@ -522,6 +747,9 @@ class Model(TrackedInstance):
             This will override any defaults set in the function definition.
         :param trainer_kwargs: a dictionary mapping training parameter names to values. There training parameters
             are determined by the keyword-only arguments of the ``model.trainer`` function.
+        :param use_flyte: if True, train the model by executing the training workflow locally with flytekit, which
+            type-checks and serializes the data passed between tasks the same way a Flyte backend would. If False,
+            call the registered functions directly in-process, which skips this overhead.
         :param reader_kwargs: keyword arguments that correspond to the :meth:`unionml.Dataset.reader` method signature.
         
         The train method invokes an execution graph that composes together the following functions to train and evaluate a model:
@@ -536,6 +764,19 @@ class Model(TrackedInstance):
         
         """
         trainer_kwargs = {} if trainer_kwargs is None else trainer_kwargs
+        if not use_flyte:
+            hyperparameters = self.hyperparameter_type(**({} if hyperparameters is None else hyperparameters))
+            model_obj, metrics = self._train(
+                asdict(hyperparameters) if isinstance(hyperparameters, BaseHyperparameters) else hyperparameters,
+                self._read(**reader_kwargs),
+                trainer_kwargs,
+                loader_kwargs=loader_kwargs,
+                splitter_kwargs=splitter_kwargs,
+                parser_kwargs=parser_kwargs,
+            )
+            self.artifact = ModelArtifact(model_obj, hyperparameters, metrics)
+            return model_obj, metrics
+
         model_obj, hyperparameters, metrics = self.train_workflow()(
             hyperparameters=self.hyperparameter_type(**({} if hyperparameters is None else hyperparameters)),
             loader_kwargs=self._dataset.loader_kwargs_type(**({} if loader_kwargs is None else loader_kwargs)),
@@ -549,6 +790,7 @@ class Model(TrackedInstance):
     def predict(
         self,
         features: Any = None,
+        use_flyte: bool = True,
         **reader_kwargs,
     ):
         """Generate predictions locally.
@@ -561,6 +803,9 @@ class Model(TrackedInstance):
 
             - :meth:`unionml.dataset.Dataset.feature_loader`
             - :meth:`unionml.dataset.Dataset.feature_transformer`
+        :param use_flyte: if True, generate predictions by executing the prediction workflow locally with flytekit.
+            If False, call the registered functions directly in-process, which skips flytekit's type conversion of
+            the inputs and outputs.
         :param reader_kwargs: keyword arguments that correspond to the :meth:`unionml.Dataset.reader` method signature.
         """
         if features is None and not reader_kwargs:
@@ -570,6 +815,10 @@ class Model(TrackedInstance):
                 "ModelArtifact not found. You must train a model first with the `train` method before generating "
                 "predictions."
             )
+        if not use_flyte:
+            if features is None:
+                return self._predict_from_raw_data(self.artifact.model_object, self._read(**reader_kwargs))
+            return self._predictor(self.artifact.model_object, self._dataset.get_features(features))
         if features is None:
             return self.predict_workflow()(model_object=self.artifact.model_object, **reader_kwargs)
         return self.predict_from_features_workflow()(
@@ -578,7 +827,19 @@ class Model(TrackedInstance):
         )
 
     def save(self, file: Union[str, os.PathLike, IO], *args, **kwargs):
-        """Save the model object to disk."""
+        """Save the model object to disk.
+
+        By default, sklearn estimators are saved in a safetensors-style format: a JSON header containing the
+        estimator class, parameters, and fitted attributes, followed by the raw bytes of its numeric arrays. Pass
+        ``format="pickle"`` to serialize with ``joblib`` instead, in which case ``args`` and ``kwargs`` are forwarded
+        to ``joblib.dump``. If ``format`` isn't specified and ``args`` or ``kwargs`` are passed, e.g. ``compress=3``,
+        the ``joblib`` format is used. Estimators that can't be represented in the safetensors-style format are always
+        pickled.
+
+        Previous versions of unionml saved sklearn estimators with ``joblib`` by default. :meth:`unionml.Model.load`
+        reads both formats, but files in the safetensors-style format can't be read with ``joblib.load``, so use
+        ``format="pickle"`` if other tools need to load the file.
+        """
         if self.artifact is None:
             raise AttributeError("`artifact` property is None. Call the `train` method to train a model first")
         return self._saver(self.artifact.model_object, self.artifact.hyperparameters, file, *args, **kwargs)
@@ -919,7 +1180,34 @@ class Model(TrackedInstance):
     @property
     def model_type(self) -> Type:
         init = self._init_callable if self._init == self._default_init else self._init or self._init_callable
-        return init if inspect.isclass(init) else signature(init).return_annotation if init is not None else init
+        return init if inspect.isclass(init) else _signature(init).return_annotation if init is not None else init
+
+    def _read(self, **reader_kwargs) -> Any:
+        # datasets created from flytekit tasks don't have a reader function
+        if self._dataset._reader is None:
+            return self._dataset.dataset_task()(**reader_kwargs)
+        return self._dataset._reader(**reader_kwargs)
+
+    def _train(
+        self,
+        hyperparameters_dict: Dict[str, Any],
+        raw_data: Any,
+        trainer_kwargs: Dict[str, Any],
+        **data_kwargs,
+    ) -> Tuple[Any, Dict[str, Any]]:
+        training_data = self._dataset.get_data(raw_data, **data_kwargs)
+        model_object = self._trainer(
+            self._init(hyperparameters=hyperparameters_dict),
+            *training_data["train"],
+            **trainer_kwargs,
+        )
+        metrics = {split_key: self._evaluator(model_object, *training_data[split_key]) for split_key in training_data}
+        return model_object, metrics
+
+    def _predict_from_raw_data(self, model_object: Any, raw_data: Any) -> Any:
+        parsed_data = self._dataset._parser(raw_data, **self._dataset.parser_kwargs)
+        features = parsed_data[self._dataset._parser_feature_key]
+        return self._predictor(model_object, features)
 
     def _default_init(self, hyperparameters: dict) -> Any:
         if self._init_callable is None:
@@ -934,8 +1222,20 @@ class Model(TrackedInstance):
         hyperparameters: Union[dict, BaseHyperparameters, None],
         file: Union[str, os.PathLike, IO],
         *args,
+        format: Optional[str] = None,
         **kwargs,
     ) -> Any:
+        if format not in {None, "safetensors", "pickle"}:
+            raise ValueError(f"format must be one of 'safetensors' or 'pickle', found {format}")
+        if format == "safetensors" and (args or kwargs):
+            raise TypeError(
+                "The safetensors format doesn't take additional arguments, found "
+                f"args={args}, kwargs={kwargs}. Use format='pickle' to pass arguments to joblib.dump."
+            )
+        if format is None:
+            # additional arguments are meant for joblib.dump, so don't silently ignore them
+            format = "pickle" if args or kwargs else "safetensors"
+
         model_type = self.model_type
         hyperparameters = (
             asdict(hyperparameters)
@@ -943,6 +1243,10 @@ class Model(TrackedInstance):
             else hyperparameters
         )
         if isinstance(model_obj, sklearn.base.BaseEstimator):
+            if format == "safetensors" and _save_sklearn_safetensors(model_obj, hyperparameters, file):
+                return file
+            # use the highest available pickle protocol, i.e. protocol 5 with out-of-band buffers on python>=3.8
+            kwargs.setdefault("protocol", pickle.HIGHEST_PROTOCOL)
             return joblib.dump({"model_obj": model_obj, "hyperparameters": hyperparameters}, file, *args, **kwargs)
         elif is_pytorch_model(model_type):
             import torch
@@ -965,6 +1269,10 @@ class Model(TrackedInstance):
     def _default_loader(self, file: Union[str, os.PathLike, IO], *args, **kwargs) -> Any:
         model_type = self.model_type
         if issubclass(model_type, sklearn.base.BaseEstimator):
+            safetensors_model = _load_sklearn_safetensors(file)
+            if safetensors_model is not None:
+                model_obj, _ = safetensors_model
+                return model_obj
             deserialized_model = joblib.load(file, *args, **kwargs)
             return deserialized_model["model_obj"]
         elif is_pytorch_model(model_type):
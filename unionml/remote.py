@@ -1,6 +1,7 @@
 """Module for flyte remote helper functions."""
 
 import contextlib
+import functools
 import importlib
 import pathlib
 import typing
@@ -26,11 +27,17 @@ class VersionFetchError(RuntimeError):
 
 
 def get_model(app: str, reload: bool = False) -> Model:
-    module_name, model_var = app.split(":")
-    module = importlib.import_module(module_name)
     if reload:
-        importlib.reload(module)
-    return getattr(module, model_var)
+        module_name, _ = app.split(":")
+        importlib.reload(importlib.import_module(module_name))
+        _resolve_model.cache_clear()
+    return _resolve_model(app)
+
+
+@functools.lru_cache(maxsize=None)
+def _resolve_model(app: str) -> Model:
+    module_name, model_var = app.split(":")
+    return getattr(importlib.import_module(module_name), model_var)
 
 
 def create_project(remote: FlyteRemote, project: typing.Optional[str]):
@@ -32,7 +32,7 @@ def trainer(estimator: LogisticRegression, features: pd.DataFrame, target: pd.Da
 
 @model.predictor
 def predictor(estimator: LogisticRegression, features: pd.DataFrame) -> List[float]:
-    return [float(x) for x in estimator.predict(features)]
+    return estimator.predict(features).astype(float).tolist()
 
 
 @model.evaluator
@@ -82,5 +82,5 @@ if __name__ == "__main__":
     predictions = model.predict(features=load_digits(as_frame=True).frame.sample(5, random_state=42))
     print(model_object, metrics, predictions, sep="\n")
 
-    # save model to a file, using joblib as the default serialization format
-    model.save("./model_object.joblib")
+    # save model to a file, using the safetensors-style format for sklearn models by default
+    model.save("./model_object.bin")
@@ -105,5 +105,5 @@ if __name__ == "__main__":
     prediction = model.predict(features.squeeze(0))
     print(model_object, metrics, prediction, sep="\n")
 
-    # save model to a file, using joblib as the default serialization format
-    model.save("/tmp/model_object.joblib")
+    # save model to a file, using torch.save as the default serialization format for pytorch models
+    model.save("/tmp/model_object.pt")
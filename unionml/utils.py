@@ -1,12 +1,32 @@
+import json
 import typing
 from functools import partial, wraps
 from inspect import Parameter, signature
 
 from flytekit import task
 
+try:
+    import orjson  # optional, faster json parser
+except ImportError:
+    orjson = None  # type: ignore
+
 from unionml.task_resolver import task_resolver
 
 
+def json_loads(value: typing.Union[str, bytes]) -> typing.Any:
+    """Parse a json document, using orjson when it's installed.
+
+    orjson rejects the ``NaN`` and ``Infinity`` constants that the standard library accepts, so documents it can't
+    parse are handed to :func:`json.loads`. This keeps the accepted inputs the same whether or not orjson is installed.
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(value)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(value)
+
+
 def inner_task(
     fn=None,
     *,